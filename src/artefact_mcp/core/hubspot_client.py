@@ -7,7 +7,7 @@ Uses httpx for async-compatible HTTP requests.
 
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 import httpx
 
@@ -82,11 +82,18 @@ class HubSpotClient:
         First fetches pipeline definitions to identify closed stage IDs,
         then filters them out server-side.
         """
+        return list(self.iter_open_deals(pipeline_id))
+
+    def iter_open_deals(self, pipeline_id: Optional[str] = None) -> Iterator[dict]:
+        """Yield open deals page by page, optionally filtered by pipeline.
+
+        Same query as fetch_open_deals, but each page of results is yielded
+        as soon as it arrives instead of collecting every page first.
+        """
         # Step 1: Get all closed stage IDs across pipelines
         closed_stage_ids = self._get_closed_stage_ids(pipeline_id)
 
         # Step 2: Search for deals, excluding closed stages
-        deals = []
         after = "0"
         pages = 0
 
@@ -123,7 +130,7 @@ class HubSpotClient:
 
             for deal in data.get("results", []):
                 props = deal.get("properties", {})
-                deals.append({
+                yield {
                     "id": deal.get("id"),
                     "name": props.get("dealname"),
                     "amount": self._safe_float(props.get("amount")),
@@ -132,7 +139,7 @@ class HubSpotClient:
                     "create_date": self._parse_date(props.get("createdate")),
                     "close_date": self._parse_date(props.get("closedate")),
                     "last_modified": self._parse_date(props.get("hs_lastmodifieddate")),
-                })
+                }
 
             paging = data.get("paging", {})
             if paging.get("next"):
@@ -140,8 +147,6 @@ class HubSpotClient:
             else:
                 break
 
-        return deals
-
     def _get_closed_stage_ids(self, pipeline_id: Optional[str] = None) -> set[str]:
         """Fetch pipeline definitions and return IDs of all closed stages."""
         closed_ids: set[str] = set()
@@ -410,9 +415,10 @@ class HubSpotClient:
             if not company_id:
                 continue
 
-            if company_id not in company_data:
+            entry = company_data.get(company_id)
+            if entry is None:
                 company_info = companies.get(company_id, {})
-                company_data[company_id] = {
+                entry = company_data[company_id] = {
                     "client_id": company_id,
                     "client_name": company_info.get("name", "Unknown"),
                     "total_revenue": 0,
@@ -424,14 +430,14 @@ class HubSpotClient:
                     "state_region": company_info.get("state_region"),
                 }
 
-            company_data[company_id]["total_revenue"] += deal.get("amount", 0)
-            company_data[company_id]["transaction_count"] += 1
+            entry["total_revenue"] += deal.get("amount", 0)
+            entry["transaction_count"] += 1
 
             close_date = deal.get("close_date")
             if close_date:
-                current_last = company_data[company_id]["last_purchase_date"]
+                current_last = entry["last_purchase_date"]
                 if not current_last or close_date > current_last:
-                    company_data[company_id]["last_purchase_date"] = close_date
+                    entry["last_purchase_date"] = close_date
 
         return list(company_data.values())
 
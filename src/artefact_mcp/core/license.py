@@ -6,8 +6,11 @@ Free tier (sample data) works without a license key.
 Pro/Enterprise tiers require a valid ARTEFACT_LICENSE_KEY.
 """
 
+import hashlib
+import hmac
 import json
 import os
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,6 +26,9 @@ LEMONSQUEEZY_VALIDATE_URL = "https://api.lemonsqueezy.com/v1/licenses/validate"
 CACHE_TTL_SECONDS = 86400  # 24 hours
 CACHE_FILE = Path.home() / ".artefact-mcp" / "license_cache.json"
 
+# Dev bypass keys, stored by hash only (see _hash_key)
+_DEV_BYPASS_HASHES = frozenset({"425e17387f7d9311"})
+
 # Tier mapping from LemonSqueezy variant names
 TIER_MAP = {
     "pro": "pro",
@@ -30,7 +36,7 @@ TIER_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class LicenseInfo:
     """Validated license information."""
 
@@ -53,7 +59,7 @@ def validate_license(license_key: Optional[str] = None) -> LicenseInfo:
 
     # Dev bypass: skip LemonSqueezy validation for local testing.
     # Key is verified by hash only — the actual key is not stored in source.
-    if _hash_key(key) == "425e17387f7d9311":
+    if _is_dev_bypass(key):
         return LicenseInfo(valid=True, tier="pro", customer_name="Dev Testing")
 
     # Check local cache first
@@ -178,7 +184,7 @@ def _read_cache(license_key: str, grace_ttl: Optional[int] = None) -> Optional[L
         if not CACHE_FILE.exists():
             return None
 
-        data = json.loads(CACHE_FILE.read_text())
+        data = json.loads(CACHE_FILE.read_bytes())
         cached_key = data.get("key_hash")
 
         # Compare hash, not raw key (don't store keys on disk)
@@ -213,12 +219,28 @@ def _write_cache(license_key: str, info: LicenseInfo) -> None:
             "expires_at": info.expires_at,
             "cached_at": time.time(),
         }
-        CACHE_FILE.write_text(json.dumps(data))
+        # Write a uniquely named sibling, then rename over the cache: readers
+        # and concurrent writers (servers started together) never see a partial file
+        fd, tmp_name = tempfile.mkstemp(
+            dir=CACHE_FILE.parent, prefix=f".{CACHE_FILE.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(data).encode())
+            os.replace(tmp_name, CACHE_FILE)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
     except OSError:
         pass  # Cache write failure is non-fatal
 
 
 def _hash_key(key: str) -> str:
     """Hash a license key for safe local storage."""
-    import hashlib
     return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def _is_dev_bypass(key: str) -> bool:
+    """Check a key against the dev bypass hashes in constant time."""
+    key_hash = _hash_key(key)
+    return any(hmac.compare_digest(key_hash, h) for h in _DEV_BYPASS_HASHES)
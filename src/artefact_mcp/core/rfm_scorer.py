@@ -15,7 +15,11 @@ def _percentile(data: list[float], p: float) -> float:
     """
     if not data:
         return 0.0
-    sorted_data = sorted(data)
+    return _percentile_sorted(sorted(data), p)
+
+
+def _percentile_sorted(sorted_data: list[float], p: float) -> float:
+    """Same as _percentile, for data that is already sorted ascending."""
     n = len(sorted_data)
     if n == 1:
         return sorted_data[0]
@@ -35,17 +39,23 @@ class RFMScorer:
         self.thresholds = thresholds or {}
         self._cached_percentiles: dict[tuple, list[float]] = {}
 
+        # Resolve per-dimension config once; scoring runs once per client
+        recency = self.thresholds.get("recency", {})
+        self._recency_days = recency.get("days", [30, 90, 180, 365])
+        self._recency_scores = recency.get("scores", [5, 4, 3, 2, 1])
+        frequency = self.thresholds.get("frequency", {})
+        self._frequency_counts = frequency.get("counts", [10, 5, 3, 2])
+        self._frequency_scores = frequency.get("scores", [5, 4, 3, 2, 1])
+        self._monetary_config = self.thresholds.get("monetary", {})
+
     def score_recency(self, days_since: int) -> int:
         """Score based on days since last purchase (lower = better).
 
         Default thresholds:
             0-30 days: 5 | 31-90: 4 | 91-180: 3 | 181-365: 2 | 366+: 1
         """
-        config = self.thresholds.get("recency", {})
-        thresholds = config.get("days", [30, 90, 180, 365])
-        scores = config.get("scores", [5, 4, 3, 2, 1])
-
-        for i, threshold in enumerate(thresholds):
+        scores = self._recency_scores
+        for i, threshold in enumerate(self._recency_days):
             if days_since <= threshold:
                 return scores[i]
         return scores[-1]
@@ -56,11 +66,8 @@ class RFMScorer:
         Default thresholds:
             10+: 5 | 5-9: 4 | 3-4: 3 | 2: 2 | 1: 1
         """
-        config = self.thresholds.get("frequency", {})
-        thresholds = config.get("counts", [10, 5, 3, 2])
-        scores = config.get("scores", [5, 4, 3, 2, 1])
-
-        for i, threshold in enumerate(thresholds):
+        scores = self._frequency_scores
+        for i, threshold in enumerate(self._frequency_counts):
             if transaction_count >= threshold:
                 return scores[i]
         return scores[-1]
@@ -70,26 +77,48 @@ class RFMScorer:
 
         Default: Top 20% = 5, 60-80% = 4, 40-60% = 3, 20-40% = 2, Bottom 20% = 1
         """
-        config = self.thresholds.get("monetary", {})
+        config = self._monetary_config
         method = config.get("method", "percentile")
 
         if method == "fixed":
             return self._score_monetary_fixed(revenue, config)
         return self._score_monetary_percentile(revenue, all_revenues, config)
 
+    def score_monetary_batch(self, revenues: list[float]) -> list[int]:
+        """Score every revenue in ``revenues`` against the same population.
+
+        Equivalent to ``[score_monetary(r, revenues) for r in revenues]``, but
+        the percentile cuts are computed once instead of looked up per client.
+        """
+        config = self._monetary_config
+        if config.get("method", "percentile") == "fixed":
+            return [self._score_monetary_fixed(r, config) for r in revenues]
+        thresholds = self._percentile_thresholds(revenues, config)
+        return [self._percentile_score(r, thresholds) for r in revenues]
+
     def _score_monetary_percentile(
         self, revenue: float, all_revenues: list[float], config: dict
     ) -> int:
+        thresholds = self._percentile_thresholds(all_revenues, config)
+        return self._percentile_score(revenue, thresholds)
+
+    def _percentile_thresholds(self, all_revenues: list[float], config: dict) -> list[float]:
         percentiles = config.get("percentiles", [80, 60, 40, 20])
 
-        cache_key = tuple(sorted(all_revenues))
+        # Keyed on the revenues as given (no per-call sort); the list is
+        # sorted once on a miss and shared by every percentile cut.
+        cache_key = (tuple(all_revenues), tuple(percentiles))
         if cache_key not in self._cached_percentiles:
+            sorted_revenues = sorted(all_revenues)
             self._cached_percentiles[cache_key] = [
-                _percentile(all_revenues, p) for p in percentiles
+                _percentile_sorted(sorted_revenues, p) if sorted_revenues else 0.0
+                for p in percentiles
             ]
 
-        thresholds = self._cached_percentiles[cache_key]
+        return self._cached_percentiles[cache_key]
 
+    @staticmethod
+    def _percentile_score(revenue: float, thresholds: list[float]) -> int:
         if revenue >= thresholds[0]:
             return 5
         elif revenue >= thresholds[1]:
@@ -5,6 +5,7 @@ Assigns customers to segments based on their R, F, M scores.
 Implements 11 standard RFM segments.
 """
 
+from collections import Counter
 from typing import Optional
 
 
@@ -195,24 +196,15 @@ class ICPAnalyzer:
     def _analyze_dimension(
         self, top: list[dict], all_clients: list[dict], field: str
     ) -> dict:
-        top_counts: dict[str, int] = {}
-        for client in top:
-            value = client.get(field, "Unknown")
-            top_counts[value] = top_counts.get(value, 0) + 1
-
-        all_counts: dict[str, int] = {}
-        for client in all_clients:
-            value = client.get(field, "Unknown")
-            all_counts[value] = all_counts.get(value, 0) + 1
+        top_counts = Counter(client.get(field, "Unknown") for client in top)
+        all_counts = Counter(client.get(field, "Unknown") for client in all_clients)
+        n_top = len(top)
+        n_all = len(all_clients)
 
         results = []
         for value, count in top_counts.items():
-            pct_top = count / len(top) * 100 if top else 0
-            pct_all = (
-                all_counts.get(value, 0) / len(all_clients) * 100
-                if all_clients
-                else 0
-            )
+            pct_top = count / n_top * 100
+            pct_all = all_counts[value] / n_all * 100 if n_all else 0
             lift = pct_top / pct_all if pct_all > 0 else 0
 
             results.append(
@@ -17,6 +17,7 @@ This tool does NOT write to the CRO app — it outputs a commit proposal
 that a human reviews and approves.
 """
 
+import re
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -72,6 +73,13 @@ RISK_FACTORS = {
     "playbook": {"base_risk": "low", "blast_radius": "low"},
 }
 
+# Keywords that escalate risk (plain substring match on the lowercased description)
+HIGH_RISK_KEYWORDS = ("remove", "delete", "replace", "restructure", "migrate", "overhaul")
+MEDIUM_RISK_KEYWORDS = ("add", "modify", "update", "adjust", "refine")
+
+_HIGH_RISK_RE = re.compile("|".join(map(re.escape, HIGH_RISK_KEYWORDS)))
+_MEDIUM_RISK_RE = re.compile("|".join(map(re.escape, MEDIUM_RISK_KEYWORDS)))
+
 
 def _assess_risk(
     entity_type: str,
@@ -83,20 +91,11 @@ def _assess_risk(
     blast_radius = risk_info["blast_radius"]
 
     # Escalate risk for certain keywords
-    high_risk_keywords = ["remove", "delete", "replace", "restructure", "migrate", "overhaul"]
-    medium_risk_keywords = ["add", "modify", "update", "adjust", "refine"]
-
     desc_lower = change_description.lower()
-    for keyword in high_risk_keywords:
-        if keyword in desc_lower:
-            base_risk = "high"
-            break
-
-    if base_risk != "high":
-        for keyword in medium_risk_keywords:
-            if keyword in desc_lower:
-                base_risk = "medium" if base_risk == "low" else base_risk
-                break
+    if _HIGH_RISK_RE.search(desc_lower):
+        base_risk = "high"
+    elif base_risk == "low" and _MEDIUM_RISK_RE.search(desc_lower):
+        base_risk = "medium"
 
     return {
         "level": base_risk,
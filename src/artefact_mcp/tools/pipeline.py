@@ -8,6 +8,7 @@ Ported from useDealVelocity.ts (artefact-grow).
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from artefact_mcp.core.hubspot_client import HubSpotClient
@@ -61,11 +62,17 @@ def _parse_date(value) -> Optional[datetime]:
         return None
     if isinstance(value, datetime):
         return value
+    return _parse_date_str(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> Optional[datetime]:
+    """Parse a date string (cached: the same deal dates are re-parsed per metric)."""
     try:
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except (ValueError, TypeError):
         try:
-            return datetime.strptime(str(value), "%Y-%m-%d")
+            return datetime.strptime(value, "%Y-%m-%d")
         except (ValueError, TypeError):
             return None
 
@@ -207,11 +214,12 @@ def _find_at_risk_deals(
             risk_reasons.append(f"Open for {days_total} days (>6 months)")
 
         if risk_reasons:
+            raw_stage = deal.get("stage", "")
             at_risk.append({
                 "id": deal.get("id"),
                 "name": deal.get("name"),
                 "days_in_pipeline": days_total,
-                "stage": _labels.get(deal.get("stage", ""), deal.get("stage", "")),
+                "stage": _labels.get(raw_stage, raw_stage),
                 "amount": deal.get("amount", 0),
                 "risk_reasons": risk_reasons,
             })
@@ -58,7 +58,7 @@ def _score_client(
     client: dict,
     scorer: RFMScorer,
     segmenter: Segmenter,
-    all_revenues: list[float],
+    m: int,
     analysis_date: datetime,
 ) -> dict:
     last_purchase = client.get("last_purchase_date")
@@ -76,7 +76,6 @@ def _score_client(
 
     r = scorer.score_recency(days_since)
     f = scorer.score_frequency(client.get("transaction_count", 0))
-    m = scorer.score_monetary(client.get("total_revenue", 0), all_revenues)
 
     rfm_total = r + f + m
     segment = segmenter.classify(r, f, m)
@@ -133,10 +132,11 @@ def run_rfm_analysis(
     analysis_date = datetime.now()
 
     all_revenues = [c.get("total_revenue", 0) for c in clients]
+    m_scores = scorer.score_monetary_batch(all_revenues)
 
     scored = [
-        _score_client(c, scorer, segmenter, all_revenues, analysis_date)
-        for c in clients
+        _score_client(c, scorer, segmenter, m, analysis_date)
+        for c, m in zip(clients, m_scores)
     ]
     scored.sort(key=lambda x: x["rfm_total"], reverse=True)
 
@@ -14,7 +14,10 @@ Signal Types:
   6. data_quality - Missing fields, incomplete records
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import accumulate, takewhile
 from typing import Optional
 
 from artefact_mcp.core.hubspot_client import HubSpotClient
@@ -87,11 +90,18 @@ SIGNAL_TYPES = {
     },
 }
 
+_SIGNAL_LABELS = {k: v.get("label", k) for k, v in SIGNAL_TYPES.items()}
+
 # Benchmarks for signal detection
 VELOCITY_BENCHMARK_DAYS = 30  # Avg days per stage benchmark
 CONVERSION_BENCHMARK_PCT = 50  # Min acceptable conversion rate
 STAGNATION_THRESHOLD_DAYS = 30  # Days without activity = stagnant
 DATA_COMPLETENESS_THRESHOLD = 0.7  # 70% field completion target
+CRITICAL_SIGNAL_STRENGTH = 0.7  # Min strength reported under critical_signals
+CONCENTRATION_MIN_DEALS = 3  # Pipelines smaller than this skip concentration checks
+
+# Field values treated as "not populated" by the data quality checks
+_EMPTY_FIELD_VALUES = (None, "", 0)
 
 
 def _make_signal(
@@ -102,10 +112,9 @@ def _make_signal(
     recommended_action: str,
 ) -> dict:
     """Create a structured signal object."""
-    type_info = SIGNAL_TYPES.get(signal_type, {})
     return {
         "signal_type": signal_type,
-        "signal_label": type_info.get("label", signal_type),
+        "signal_label": _SIGNAL_LABELS.get(signal_type, signal_type),
         "signal_name": signal_name,
         "signal_strength": round(signal_strength, 2),
         "evidence": evidence,
@@ -115,14 +124,15 @@ def _make_signal(
 
 def _detect_velocity_anomalies(
     deals: list[dict],
-    now: datetime,
-    stage_order: list[str],
+    velocity: dict,
     stage_labels: dict[str, str],
 ) -> list[dict]:
     """Detect velocity anomalies — stages where deals are moving too slowly."""
     signals = []
-    velocity = _calculate_velocity(deals, now, stage_order, stage_labels)
     avg_days = velocity.get("avg_days_per_stage", {})
+    label_counts: Counter[str] = Counter()
+    for raw_stage, count in Counter(d.get("stage", "") for d in deals).items():
+        label_counts[stage_labels.get(raw_stage, raw_stage)] += count
 
     for stage_label, days in avg_days.items():
         if days > VELOCITY_BENCHMARK_DAYS * 2:
@@ -137,10 +147,7 @@ def _detect_velocity_anomalies(
                     "avg_days_in_stage": days,
                     "benchmark_days": VELOCITY_BENCHMARK_DAYS,
                     "ratio_to_benchmark": round(days / VELOCITY_BENCHMARK_DAYS, 1),
-                    "deals_affected": sum(
-                        1 for d in deals
-                        if stage_labels.get(d.get("stage", ""), d.get("stage", "")) == stage_label
-                    ),
+                    "deals_affected": label_counts.get(stage_label, 0),
                 },
                 recommended_action=(
                     f"Investigate bottleneck in {stage_label}. "
@@ -177,24 +184,22 @@ def _detect_conversion_dropoffs(
 ) -> list[dict]:
     """Detect stages where conversion rates are below benchmark."""
     signals = []
+    idx_of = {s: i for i, s in enumerate(stage_order)}
+
+    # Count deals per stage in one pass, then derive "at or past stage i"
+    # from a suffix sum instead of rescanning every deal per transition.
+    stage_counts = [0] * len(stage_order)
+    for deal in deals:
+        deal_idx = idx_of.get(deal.get("stage", ""), -1)
+        if deal_idx >= 0:
+            stage_counts[deal_idx] += 1
+    reached = list(accumulate(reversed(stage_counts)))[::-1]
 
     for i in range(len(stage_order) - 1):
         current = stage_order[i]
         next_stage = stage_order[i + 1]
-        current_idx = stage_order.index(current)
-        next_idx = stage_order.index(next_stage)
-
-        current_count = 0
-        next_count = 0
-
-        for deal in deals:
-            deal_stage = deal.get("stage", "")
-            if deal_stage in stage_order:
-                deal_idx = stage_order.index(deal_stage)
-                if deal_idx >= current_idx:
-                    current_count += 1
-                if deal_idx >= next_idx:
-                    next_count += 1
+        current_count = reached[i]
+        next_count = reached[i + 1]
 
         if current_count == 0:
             continue
@@ -257,13 +262,13 @@ def _detect_data_quality_issues(deals: list[dict]) -> list[dict]:
     if total_deals == 0:
         return signals
 
-    field_completion: dict[str, int] = {f: 0 for f in required_fields}
+    # Amounts feed both the completion count and the zero-amount check below
+    amounts = [deal.get("amount", 0) for deal in deals]
 
-    for deal in deals:
-        for field in required_fields:
-            value = deal.get(field)
-            if value is not None and value != "" and value != 0:
-                field_completion[field] += 1
+    field_completion: dict[str, int] = {}
+    for field in required_fields:
+        values = amounts if field == "amount" else (deal.get(field) for deal in deals)
+        field_completion[field] = sum(1 for value in values if value not in _EMPTY_FIELD_VALUES)
 
     incomplete_fields = []
     for field, count in field_completion.items():
@@ -297,7 +302,7 @@ def _detect_data_quality_issues(deals: list[dict]) -> list[dict]:
         ))
 
     # Check for deals with $0 amount
-    zero_amount = sum(1 for d in deals if d.get("amount", 0) == 0)
+    zero_amount = amounts.count(0)
     if zero_amount > 0:
         rate = zero_amount / total_deals
         if rate > 0.2:
@@ -319,12 +324,9 @@ def _detect_data_quality_issues(deals: list[dict]) -> list[dict]:
     return signals
 
 
-def _detect_win_loss_patterns(deals: list[dict]) -> list[dict]:
+def _detect_win_loss_patterns(deals: list[dict], at_risk: list[dict]) -> list[dict]:
     """Detect win/loss patterns from deal distribution and risk signals."""
     signals = []
-    now = datetime.now()
-
-    at_risk = _find_at_risk_deals(deals, now)
     total = len(deals)
 
     if total == 0:
@@ -373,10 +375,7 @@ def _detect_win_loss_patterns(deals: list[dict]) -> list[dict]:
         ))
 
     # Detect stagnation clustering (many deals stalled at same stage)
-    stage_stagnation: dict[str, int] = {}
-    for deal in at_risk:
-        stage = deal.get("stage", "Unknown")
-        stage_stagnation[stage] = stage_stagnation.get(stage, 0) + 1
+    stage_stagnation = Counter(deal.get("stage", "Unknown") for deal in at_risk)
 
     for stage, count in stage_stagnation.items():
         if count >= 2 and count / max(len(at_risk), 1) > 0.4:
@@ -401,51 +400,87 @@ def _detect_win_loss_patterns(deals: list[dict]) -> list[dict]:
 
 
 def _detect_pipeline_concentration(deals: list[dict], stage_labels: dict[str, str]) -> list[dict]:
-    """Detect unhealthy pipeline concentration (attribution proxy)."""
+    """Detect unhealthy pipeline concentration (attribution proxy).
+
+    Only meaningful for pipelines of at least CONCENTRATION_MIN_DEALS deals;
+    detect_signals skips it for smaller ones.
+    """
     signals = []
-    total = len(deals)
-    if total < 3:
-        return signals
 
-    # Stage concentration
-    stage_counts: dict[str, int] = {}
-    stage_values: dict[str, float] = {}
+    # Stage concentration — one pass, bucketed by position in stage_labels
+    labels = tuple(stage_labels.values())
+    label_to_pos = {label: i for i, label in enumerate(labels)}
+    stage_counts = [0] * len(labels)
+    stage_values = [0] * len(labels)
     total_value = 0
 
     for deal in deals:
-        stage = stage_labels.get(deal.get("stage", ""), deal.get("stage", ""))
-        stage_counts[stage] = stage_counts.get(stage, 0) + 1
-        stage_values[stage] = stage_values.get(stage, 0) + deal.get("amount", 0)
-        total_value += deal.get("amount", 0)
+        amount = deal.get("amount", 0) or 0
+        raw_stage = deal.get("stage", "")
+        pos = label_to_pos.get(stage_labels.get(raw_stage, raw_stage))
+        if pos is not None:
+            stage_counts[pos] += 1
+            stage_values[pos] += amount
+        total_value += amount
 
     # Check if > 60% of pipeline value is in early stages
-    early_stages = list(stage_labels.values())[:2] if stage_labels else []
-    early_value = sum(stage_values.get(s, 0) for s in early_stages)
+    early_value = sum(stage_values[:2])
 
-    if total_value > 0 and early_value / total_value > 0.6:
-        signals.append(_make_signal(
-            signal_type="attribution_shift",
-            signal_name="Pipeline value concentrated in early stages",
-            signal_strength=min(0.7, early_value / total_value),
-            evidence={
-                "early_stage_value": round(early_value, 2),
-                "total_pipeline_value": round(total_value, 2),
-                "early_stage_pct": round(early_value / total_value * 100, 1),
-                "stage_breakdown": {
-                    s: {"count": stage_counts.get(s, 0), "value": round(stage_values.get(s, 0), 2)}
-                    for s in stage_labels.values()
-                },
-            },
-            recommended_action=(
-                f"{early_value / total_value * 100:.0f}% of pipeline value sits in early stages. "
-                "This indicates pipeline progression issues — deals enter but don't advance. "
-                "Focus on conversion optimization in early-to-mid pipeline transitions."
-            ),
-        ))
+    if total_value <= 0:
+        return signals
+    early_share = early_value / total_value
+    if early_share <= 0.6:
+        return signals
+
+    # Only built when the signal fires
+    stage_breakdown = {
+        label: {"count": stage_counts[i], "value": round(stage_values[i], 2)}
+        for i, label in enumerate(labels)
+    }
+    signals.append(_make_signal(
+        signal_type="attribution_shift",
+        signal_name="Pipeline value concentrated in early stages",
+        signal_strength=min(0.7, early_share),
+        evidence={
+            "early_stage_value": round(early_value, 2),
+            "total_pipeline_value": round(total_value, 2),
+            "early_stage_pct": round(early_share * 100, 1),
+            "stage_breakdown": stage_breakdown,
+        },
+        recommended_action=(
+            f"{early_share * 100:.0f}% of pipeline value sits in early stages. "
+            "This indicates pipeline progression issues — deals enter but don't advance. "
+            "Focus on conversion optimization in early-to-mid pipeline transitions."
+        ),
+    ))
 
     return signals
 
 
+def _fetch_deals_and_stages(
+    hubspot_client: HubSpotClient,
+    pipeline_id: Optional[str],
+) -> tuple[list[dict], list[dict]]:
+    """Fetch open deals and pipeline stages from HubSpot concurrently.
+
+    The two requests are independent, so they are issued in parallel to save
+    a network round trip. Stage lookup failures fall back to an empty list
+    (callers then use the default stages); deal fetch errors propagate.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        deals_future = pool.submit(hubspot_client.fetch_open_deals, pipeline_id)
+        stages_future = pool.submit(
+            hubspot_client.fetch_pipeline_stages, pipeline_id or "default"
+        )
+        deals = deals_future.result()
+        try:
+            hs_stages = stages_future.result()
+        except (ValueError, Exception):
+            hs_stages = []
+
+    return deals, hs_stages or []
+
+
 def detect_signals(
     source: str = "hubspot",
     hubspot_client: Optional[HubSpotClient] = None,
@@ -462,6 +497,7 @@ def detect_signals(
         Dict with detected signals, summary, and signal-to-action mapping.
     """
     now = datetime.now()
+    hs_stages: list[dict] = []
 
     if source == "sample":
         deals = _get_sample_deals()
@@ -471,7 +507,7 @@ def detect_signals(
                 "HubSpot client required for source='hubspot'. "
                 "Set HUBSPOT_API_KEY environment variable."
             )
-        deals = hubspot_client.fetch_open_deals(pipeline_id)
+        deals, hs_stages = _fetch_deals_and_stages(hubspot_client, pipeline_id)
     else:
         raise ValueError(f"Invalid source: {source}. Use 'hubspot' or 'sample'.")
 
@@ -491,31 +527,32 @@ def detect_signals(
     stage_order = DEFAULT_STAGE_ORDER
     stage_labels = STAGE_LABELS
 
-    if source == "hubspot" and hubspot_client:
-        try:
-            hs_stages = hubspot_client.fetch_pipeline_stages(pipeline_id or "default")
-            if hs_stages:
-                stage_order = [s["id"] for s in hs_stages]
-                stage_labels = {s["id"]: s["label"] for s in hs_stages}
-        except (ValueError, Exception):
-            pass
+    if hs_stages:
+        stage_order = [s["id"] for s in hs_stages]
+        stage_labels = {s["id"]: s["label"] for s in hs_stages}
+
+    # Shared views of the deal set, computed once for all detectors
+    velocity = _calculate_velocity(deals, now, stage_order, stage_labels)
+    at_risk = _find_at_risk_deals(deals, now)
 
     # Run all signal detectors
     all_signals = []
-    all_signals.extend(_detect_velocity_anomalies(deals, now, stage_order, stage_labels))
-    all_signals.extend(_detect_conversion_dropoffs(deals, stage_order, stage_labels))
+    all_signals.extend(_detect_velocity_anomalies(deals, velocity, stage_labels))
+    if len(stage_order) >= 2:
+        all_signals.extend(_detect_conversion_dropoffs(deals, stage_order, stage_labels))
     all_signals.extend(_detect_data_quality_issues(deals))
-    all_signals.extend(_detect_win_loss_patterns(deals))
-    all_signals.extend(_detect_pipeline_concentration(deals, stage_labels))
+    all_signals.extend(_detect_win_loss_patterns(deals, at_risk))
+    if len(deals) >= CONCENTRATION_MIN_DEALS:
+        all_signals.extend(_detect_pipeline_concentration(deals, stage_labels))
 
-    # Sort by strength (highest first)
+    # Sort by strength (highest first); critical signals are then a prefix
     all_signals.sort(key=lambda s: s["signal_strength"], reverse=True)
+    critical_signals = list(
+        takewhile(lambda s: s["signal_strength"] >= CRITICAL_SIGNAL_STRENGTH, all_signals)
+    )
 
     # Summary
-    type_counts: dict[str, int] = {}
-    for sig in all_signals:
-        st = sig["signal_type"]
-        type_counts[st] = type_counts.get(st, 0) + 1
+    type_counts = dict(Counter(sig["signal_type"] for sig in all_signals))
 
     return {
         "signals": all_signals,
@@ -524,7 +561,7 @@ def detect_signals(
             "signal_types_detected": list(type_counts.keys()),
             "signal_type_counts": type_counts,
             "highest_strength_signal": all_signals[0] if all_signals else None,
-            "critical_signals": [s for s in all_signals if s["signal_strength"] >= 0.7],
+            "critical_signals": critical_signals,
         },
         "signal_taxonomy": SIGNAL_TYPES,
         "scan_date": now.strftime("%Y-%m-%d"),
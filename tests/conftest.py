@@ -0,0 +1,69 @@
+"""Shared fixtures: canned HubSpot API responses replayed through respx."""
+
+import httpx
+import pytest
+import respx
+
+from artefact_mcp.core.hubspot_client import HubSpotClient
+
+
+HUBSPOT_PIPELINE = {
+    "id": "default",
+    "label": "Sales Pipeline",
+    "stages": [
+        {"id": "appointmentscheduled", "label": "Discovery", "displayOrder": 0, "metadata": {"isClosed": "false"}},
+        {"id": "qualifiedtobuy", "label": "Qualified", "displayOrder": 1, "metadata": {"isClosed": "false"}},
+        {"id": "presentationscheduled", "label": "Demo", "displayOrder": 2, "metadata": {"isClosed": "false"}},
+        {"id": "contractsent", "label": "Contract Sent", "displayOrder": 3, "metadata": {"isClosed": "false"}},
+        {"id": "closedwon", "label": "Closed Won", "displayOrder": 4, "metadata": {"isClosed": "true"}},
+        {"id": "closedlost", "label": "Closed Lost", "displayOrder": 5, "metadata": {"isClosed": "true"}},
+    ],
+}
+
+HUBSPOT_OPEN_DEALS = {
+    "results": [
+        {"id": "101", "properties": {"dealname": "Northwind - Rollout", "amount": "48000", "dealstage": "appointmentscheduled", "pipeline": "default", "createdate": "2025-06-02T14:00:00Z", "closedate": "2025-09-30T00:00:00Z", "hs_lastmodifieddate": "2025-07-15T09:30:00Z"}},
+        {"id": "102", "properties": {"dealname": "Contoso - Audit", "amount": "12500", "dealstage": "qualifiedtobuy", "pipeline": "default", "createdate": "2025-11-20T10:00:00Z", "closedate": None, "hs_lastmodifieddate": "2026-01-05T16:45:00Z"}},
+        {"id": "103", "properties": {"dealname": "Fabrikam - Expansion", "amount": None, "dealstage": "presentationscheduled", "pipeline": "default", "createdate": "2026-02-11T08:15:00Z", "closedate": "2026-12-15T00:00:00Z", "hs_lastmodifieddate": "2026-03-01T12:00:00Z"}},
+        {"id": "104", "properties": {"dealname": "Tailspin - Pilot", "amount": "30000", "dealstage": "contractsent", "pipeline": "default", "createdate": "2025-03-18T11:20:00Z", "closedate": "2025-08-01T00:00:00Z", "hs_lastmodifieddate": "2025-04-02T13:10:00Z"}},
+    ],
+}
+
+HUBSPOT_COMPANY = {
+    "id": "5001",
+    "properties": {
+        "name": "Northwind Traders",
+        "domain": "northwind.example",
+        "industry": "SaaS",
+        "numberofemployees": "120",
+        "annualrevenue": "12000000",
+        "state": "Quebec",
+        "country": "Canada",
+    },
+}
+
+
+@pytest.fixture
+def hubspot_api():
+    """Replay canned HubSpot API responses; no request reaches the network."""
+    with respx.mock(base_url=HubSpotClient.BASE_URL, assert_all_called=False) as router:
+        router.get("/crm/v3/pipelines/deals").mock(
+            return_value=httpx.Response(200, json={"results": [HUBSPOT_PIPELINE]})
+        )
+        router.get("/crm/v3/pipelines/deals/default").mock(
+            return_value=httpx.Response(200, json=HUBSPOT_PIPELINE)
+        )
+        router.post("/crm/v3/objects/deals/search").mock(
+            return_value=httpx.Response(200, json=HUBSPOT_OPEN_DEALS)
+        )
+        router.get(f"/crm/v3/objects/companies/{HUBSPOT_COMPANY['id']}").mock(
+            return_value=httpx.Response(200, json=HUBSPOT_COMPANY)
+        )
+        yield router
+
+
+@pytest.fixture
+def hubspot_client(hubspot_api):
+    """HubSpotClient wired to the replayed API."""
+    with HubSpotClient(api_key="test-key") as client:
+        yield client
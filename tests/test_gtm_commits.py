@@ -78,6 +78,20 @@ class TestProposeGTMChange:
         risk = result["commit_proposal"]["risk"]
         assert risk["level"] == "low"
 
+    def test_risk_keyword_escalation(self):
+        # Medium keywords lift a low-risk entity to medium; high keywords win outright
+        result = propose_gtm_change(
+            entity_type="playbook",
+            change_description="Update the objection handling section",
+        )
+        assert result["commit_proposal"]["risk"]["level"] == "medium"
+
+        result = propose_gtm_change(
+            entity_type="playbook",
+            change_description="Add a pricing page and remove the legacy demo script",
+        )
+        assert result["commit_proposal"]["risk"]["level"] == "high"
+
     def test_measurement_plan(self):
         result = propose_gtm_change(
             entity_type="icp",
@@ -98,13 +112,13 @@ class TestProposeGTMChange:
         impact = result["commit_proposal"]["impact_surface"]
         assert len(impact["affected_systems"]) > 0
 
-    def test_all_entity_types(self):
-        for entity_type in ENTITY_TYPES:
-            result = propose_gtm_change(
-                entity_type=entity_type,
-                change_description=f"Test change for {entity_type}",
-            )
-            assert result["commit_proposal"]["intent"]["entity_type"] == entity_type
+    @pytest.mark.parametrize("entity_type", sorted(ENTITY_TYPES))
+    def test_all_entity_types(self, entity_type):
+        result = propose_gtm_change(
+            entity_type=entity_type,
+            change_description=f"Test change for {entity_type}",
+        )
+        assert result["commit_proposal"]["intent"]["entity_type"] == entity_type
 
     def test_invalid_entity_type(self):
         with pytest.raises(ValueError, match="Invalid entity_type"):
@@ -3,6 +3,9 @@
 import pytest
 import json
 
+import httpx
+import respx
+
 from artefact_mcp.core.hubspot_client import HubSpotClient
 
 
@@ -22,50 +25,58 @@ class TestHubSpotClientInit:
             assert client.api_key == "test...-abc"
 
 
+@pytest.fixture(scope="module")
+def hs_client():
+    """One client for the helper tests; the helpers are stateless."""
+    client = HubSpotClient(api_key="test-key")
+    yield client
+    client.close()
+
+
 class TestHubSpotClientHelpers:
-    def setup_method(self):
-        self.client = HubSpotClient(api_key="test-key")
-
-    def teardown_method(self):
-        self.client.close()
-
-    def test_safe_float(self):
-        assert self.client._safe_float("123.45") == 123.45
-        assert self.client._safe_float(None) == 0.0
-        assert self.client._safe_float("not-a-number") == 0.0
-
-    def test_safe_int(self):
-        assert self.client._safe_int("42") == 42
-        assert self.client._safe_int(None) is None
-        assert self.client._safe_int("not-a-number") is None
-
-    def test_parse_employee_band(self):
-        assert self.client._parse_employee_band("5") == "1-10"
-        assert self.client._parse_employee_band("25") == "11-50"
-        assert self.client._parse_employee_band("100") == "51-200"
-        assert self.client._parse_employee_band("300") == "201-500"
-        assert self.client._parse_employee_band("800") == "501-1000"
-        assert self.client._parse_employee_band("5000") == "1000+"
-        assert self.client._parse_employee_band(None) is None
-
-    def test_parse_revenue_band(self):
-        assert self.client._parse_revenue_band("500000") == "<$1M"
-        assert self.client._parse_revenue_band("3000000") == "$1M-$5M"
-        assert self.client._parse_revenue_band("10000000") == "$5M-$20M"
-        assert self.client._parse_revenue_band("50000000") == "$20M-$70M"
-        assert self.client._parse_revenue_band("100000000") == "$70M+"
-        assert self.client._parse_revenue_band(None) is None
-
-    def test_parse_date(self):
-        dt = self.client._parse_date("2026-01-15T10:00:00Z")
+    def test_safe_float(self, hs_client):
+        assert hs_client._safe_float("123.45") == 123.45
+        assert hs_client._safe_float(None) == 0.0
+        assert hs_client._safe_float("not-a-number") == 0.0
+
+    def test_safe_int(self, hs_client):
+        assert hs_client._safe_int("42") == 42
+        assert hs_client._safe_int(None) is None
+        assert hs_client._safe_int("not-a-number") is None
+
+    @pytest.mark.parametrize("value,expected", [
+        ("5", "1-10"),
+        ("25", "11-50"),
+        ("100", "51-200"),
+        ("300", "201-500"),
+        ("800", "501-1000"),
+        ("5000", "1000+"),
+        (None, None),
+    ])
+    def test_parse_employee_band(self, hs_client, value, expected):
+        assert hs_client._parse_employee_band(value) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        ("500000", "<$1M"),
+        ("3000000", "$1M-$5M"),
+        ("10000000", "$5M-$20M"),
+        ("50000000", "$20M-$70M"),
+        ("100000000", "$70M+"),
+        (None, None),
+    ])
+    def test_parse_revenue_band(self, hs_client, value, expected):
+        assert hs_client._parse_revenue_band(value) == expected
+
+    def test_parse_date(self, hs_client):
+        dt = hs_client._parse_date("2026-01-15T10:00:00Z")
         assert dt is not None
         assert dt.year == 2026
         assert dt.month == 1
 
-        assert self.client._parse_date(None) is None
-        assert self.client._parse_date("invalid") is None
+        assert hs_client._parse_date(None) is None
+        assert hs_client._parse_date("invalid") is None
 
-    def test_aggregate_by_company(self):
+    def test_aggregate_by_company(self, hs_client):
         deals = [
             {
                 "id": "1",
@@ -100,8 +111,75 @@ class TestHubSpotClientHelpers:
             }
         }
 
-        result = self.client._aggregate_by_company(deals, companies)
+        result = hs_client._aggregate_by_company(deals, companies)
         assert len(result) == 1
         assert result[0]["client_name"] == "Test Corp"
         assert result[0]["total_revenue"] == 30000
         assert result[0]["transaction_count"] == 2
+
+
+class TestHubSpotClientOpenDeals:
+    def _deal(self, deal_id: str, stage: str) -> dict:
+        return {
+            "id": deal_id,
+            "properties": {
+                "dealname": f"Deal {deal_id}",
+                "amount": "1000",
+                "dealstage": stage,
+                "pipeline": "default",
+                "createdate": "2026-01-15T10:00:00Z",
+            },
+        }
+
+    @respx.mock
+    def test_iter_open_deals_pages_through_results(self):
+        respx.get("https://api.hubapi.com/crm/v3/pipelines/deals").mock(
+            return_value=httpx.Response(200, json={"results": [{
+                "id": "default",
+                "stages": [
+                    {"id": "appointmentscheduled", "label": "Appointment Scheduled"},
+                    {"id": "closedwon", "label": "Closed Won"},
+                ],
+            }]})
+        )
+        search = respx.post("https://api.hubapi.com/crm/v3/objects/deals/search").mock(
+            side_effect=[
+                httpx.Response(200, json={
+                    "results": [self._deal("1", "appointmentscheduled")],
+                    "paging": {"next": {"after": "1"}},
+                }),
+                httpx.Response(200, json={
+                    "results": [self._deal("2", "appointmentscheduled")],
+                }),
+            ]
+        )
+
+        with HubSpotClient(api_key="test-key") as client:
+            deals = client.iter_open_deals()
+            first = next(deals)
+            # Second page is only requested once the first is consumed
+            assert search.call_count == 1
+            rest = list(deals)
+
+        assert [d["id"] for d in [first, *rest]] == ["1", "2"]
+        assert first["amount"] == 1000.0
+        assert search.call_count == 2
+        payload = json.loads(search.calls[0].request.content)
+        assert payload["filterGroups"][0]["filters"][0]["values"] == ["closedwon"]
+
+    @respx.mock
+    def test_fetch_open_deals_returns_list(self):
+        respx.get("https://api.hubapi.com/crm/v3/pipelines/deals").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+        respx.post("https://api.hubapi.com/crm/v3/objects/deals/search").mock(
+            return_value=httpx.Response(200, json={
+                "results": [self._deal("1", "qualifiedtobuy")],
+            })
+        )
+
+        with HubSpotClient(api_key="test-key") as client:
+            deals = client.fetch_open_deals()
+
+        assert isinstance(deals, list)
+        assert deals[0]["stage"] == "qualifiedtobuy"
@@ -6,11 +6,13 @@ from artefact_mcp.core.icp_scorer import ICPScorer, TIERS
 from artefact_mcp.tools.icp import qualify_prospect
 
 
-class TestICPScorer:
-    def setup_method(self):
-        self.scorer = ICPScorer()
+@pytest.fixture(scope="session")
+def icp_scorer():
+    return ICPScorer()
+
 
-    def test_perfect_score(self):
+class TestICPScorer:
+    def test_perfect_score(self, icp_scorer):
         data = {
             "industry": "SaaS",
             "annual_revenue": 10_000_000,
@@ -24,12 +26,12 @@ class TestICPScorer:
             "budget_authority": "dedicated",
             "strategic_alignment": "strong",
         }
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         assert result.total_score == 14.5
         assert result.tier["number"] == 1
         assert result.tier["label"] == "Ideal"
 
-    def test_zero_score(self):
+    def test_zero_score(self, icp_scorer):
         data = {
             "industry": "Unknown",
             "annual_revenue": 100,
@@ -43,54 +45,44 @@ class TestICPScorer:
             "budget_authority": "none",
             "strategic_alignment": "misaligned",
         }
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         assert result.total_score == 0
         assert result.tier["number"] == 4
 
-    def test_tier_boundaries(self):
-        # Tier 1 starts at 12.0
-        tier = self.scorer.classify_tier(12.0)
-        assert tier.number == 1
-
-        # Tier 2: 9.0 - 11.9
-        tier = self.scorer.classify_tier(9.0)
-        assert tier.number == 2
-
-        tier = self.scorer.classify_tier(11.9)
-        assert tier.number == 2
-
-        # Tier 3: 6.0 - 8.9
-        tier = self.scorer.classify_tier(6.0)
-        assert tier.number == 3
-
-        # Tier 4: 0 - 5.9
-        tier = self.scorer.classify_tier(5.9)
-        assert tier.number == 4
-
-    def test_exclusion_agency(self):
+    @pytest.mark.parametrize("score,expected_tier", [
+        (12.0, 1),  # Tier 1 starts at 12.0
+        (9.0, 2),   # Tier 2: 9.0 - 11.9
+        (11.9, 2),
+        (6.0, 3),   # Tier 3: 6.0 - 8.9
+        (5.9, 4),   # Tier 4: 0 - 5.9
+    ])
+    def test_tier_boundaries(self, icp_scorer, score, expected_tier):
+        assert icp_scorer.classify_tier(score).number == expected_tier
+
+    def test_exclusion_agency(self, icp_scorer):
         data = {"industry": "Agency", "annual_revenue": 5_000_000}
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         assert result.exclusion_check["excluded"] is True
         assert "EXCLUDED" in result.recommended_action.upper()
 
-    def test_exclusion_consulting(self):
+    def test_exclusion_consulting(self, icp_scorer):
         data = {"industry": "Consulting firm"}
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         assert result.exclusion_check["excluded"] is True
 
-    def test_non_excluded_passes(self):
+    def test_non_excluded_passes(self, icp_scorer):
         data = {"industry": "SaaS", "annual_revenue": 10_000_000}
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         assert result.exclusion_check["excluded"] is False
 
-    def test_firmographic_breakdown(self):
+    def test_firmographic_breakdown(self, icp_scorer):
         data = {
             "industry": "Technology",
             "annual_revenue": 5_000_000,
             "employee_count": 50,
             "geography": "Ontario",
         }
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         firm = result.breakdown["firmographic"]
         assert firm["max"] == 5.0
         assert firm["details"]["industry"]["score"] == 2.0
@@ -98,39 +90,73 @@ class TestICPScorer:
         assert firm["details"]["employee_count"]["score"] == 1.0
         assert firm["details"]["geography"]["score"] == 0.5
 
-    def test_behavioral_with_hubspot(self):
+    def test_behavioral_with_hubspot(self, icp_scorer):
         data = {
             "tech_stack": ["HubSpot", "Google Analytics", "Marketo"],
             "growth_signals": ["hiring", "funding"],
             "content_engagement": "active",
             "purchase_history": "regular",
         }
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         beh = result.breakdown["behavioral"]
         assert beh["details"]["tech_stack"]["score"] == 2.0
         assert beh["details"]["growth_signals"]["score"] == 1.0
         assert beh["details"]["content_engagement"]["score"] == 1.0
         assert beh["details"]["purchase_frequency"]["score"] == 0.5
 
-    def test_strategic_full(self):
+    def test_strategic_full(self, icp_scorer):
         data = {
             "decision_maker_access": "c_suite",
             "budget_authority": "dedicated",
             "strategic_alignment": "strong",
         }
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         strat = result.breakdown["strategic"]
         assert strat["score"] == 4.5
         assert strat["max"] == 4.5
 
-    def test_geography_secondary_market(self):
+    def test_geography_secondary_market(self, icp_scorer):
         data = {"geography": "New York"}
-        result = self.scorer.score_company(data)
+        result = icp_scorer.score_company(data)
         geo = result.breakdown["firmographic"]["details"]["geography"]
         assert geo["score"] == 0.25
 
 
+# Manual company_data cases, one per tier: (id, data, expected tier number)
+QUALIFY_CASES = [
+    ("tier1_ideal", {
+        "industry": "SaaS", "annual_revenue": 10_000_000, "employee_count": 80, "geography": "Quebec",
+        "tech_stack": ["HubSpot", "Google Analytics", "Marketing Automation"],
+        "growth_signals": ["hiring", "funding", "new product"],
+        "content_engagement": "active", "purchase_history": "regular",
+        "decision_maker_access": "c_suite", "budget_authority": "dedicated", "strategic_alignment": "strong",
+    }, 1),
+    ("tier2_strong", {
+        "industry": "SaaS", "annual_revenue": 10_000_000, "employee_count": 80, "geography": "Quebec",
+        "tech_stack": ["HubSpot"], "growth_signals": ["hiring"],
+        "content_engagement": "occasional", "purchase_history": "occasional",
+        "decision_maker_access": "director", "budget_authority": "shared", "strategic_alignment": "partial",
+    }, 2),
+    ("tier3_firmographic_fit", {
+        "industry": "Technology", "annual_revenue": 5_000_000, "employee_count": 50, "geography": "Ontario",
+        "tech_stack": ["HubSpot"], "decision_maker_access": "director",
+    }, 3),
+    ("tier4_poor", {
+        "industry": "Retail", "annual_revenue": 100, "employee_count": 2, "geography": "Mars",
+    }, 4),
+]
+
+
 class TestQualifyProspectTool:
+    @pytest.mark.parametrize(
+        "data,expected_tier",
+        [(data, tier) for _, data, tier in QUALIFY_CASES],
+        ids=[case_id for case_id, _, _ in QUALIFY_CASES],
+    )
+    def test_manual_company_tiers(self, data, expected_tier):
+        result = qualify_prospect(company_data={"company_name": "Matrix Co", **data})
+        assert result["tier"]["number"] == expected_tier
+
     def test_manual_company_data(self):
         data = {
             "company_name": "Test Corp",
@@ -153,6 +179,14 @@ class TestQualifyProspectTool:
         assert result["company"]["name"] == "Test Corp"
         assert result["total_score"] > 0
 
+    def test_company_id_from_hubspot(self, hubspot_client):
+        result = qualify_prospect(company_id="5001", hubspot_client=hubspot_client)
+        assert result["company"]["name"] == "Northwind Traders"
+        assert result["company"]["hubspot_id"] == "5001"
+        firm = result["breakdown"]["firmographic"]["details"]
+        assert firm["industry"]["score"] == 2.0
+        assert firm["geography"]["score"] == 0.5
+
     def test_no_input_raises(self):
         with pytest.raises(ValueError, match="Either company_id or company_data"):
             qualify_prospect()
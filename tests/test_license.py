@@ -17,19 +17,21 @@ from artefact_mcp.core.license import (
 
 
 class TestLicenseInfo:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        monkeypatch.delenv("ARTEFACT_LICENSE_KEY", raising=False)
+
     def test_free_tier_no_key(self):
         """No license key = free tier, still valid."""
-        with patch.dict("os.environ", {}, clear=True):
-            result = validate_license(None)
-            assert result.valid is True
-            assert result.tier == "free"
+        result = validate_license(None)
+        assert result.valid is True
+        assert result.tier == "free"
 
     def test_free_tier_from_env_missing(self):
         """Missing env var = free tier."""
-        with patch.dict("os.environ", {}, clear=True):
-            result = validate_license()
-            assert result.valid is True
-            assert result.tier == "free"
+        result = validate_license()
+        assert result.valid is True
+        assert result.tier == "free"
 
     def test_dev_bypass(self):
         """Dev bypass key (hash-verified) returns pro."""
@@ -38,22 +40,24 @@ class TestLicenseInfo:
         assert result.tier == "pro"
         assert result.customer_name == "Dev Testing"
 
-    def test_dev_bypass_from_env(self):
+    def test_dev_bypass_from_env(self, monkeypatch):
         """Dev bypass key works via env var."""
-        with patch.dict("os.environ", {"ARTEFACT_LICENSE_KEY": "artefact-internal-qa-2026"}):
-            result = validate_license()
-            assert result.valid is True
-            assert result.tier == "pro"
+        monkeypatch.setenv("ARTEFACT_LICENSE_KEY", "artefact-internal-qa-2026")
+        result = validate_license()
+        assert result.valid is True
+        assert result.tier == "pro"
 
-    def test_dev_bypass_wrong_key(self):
+    @patch("artefact_mcp.core.license._read_cache", return_value=None)
+    @patch(
+        "artefact_mcp.core.license._validate_remote",
+        return_value=LicenseInfo(valid=False, tier="free", error="Invalid"),
+    )
+    def test_dev_bypass_wrong_key(self, mock_remote, _mock_cache):
         """Old plaintext bypass no longer works."""
         # This would hit LemonSqueezy (mocked to fail), proving hash-only check
-        with patch("artefact_mcp.core.license._validate_remote") as mock_remote:
-            mock_remote.return_value = LicenseInfo(valid=False, tier="free", error="Invalid")
-            with patch("artefact_mcp.core.license._read_cache", return_value=None):
-                result = validate_license("dev-testing")
-                assert result.tier == "free"
-                mock_remote.assert_called_once()
+        result = validate_license("dev-testing")
+        assert result.tier == "free"
+        mock_remote.assert_called_once()
 
 
 class TestRequireLicense:
@@ -104,10 +108,20 @@ class TestHashKey:
         assert len(h) == 16
 
 
+@pytest.fixture(scope="session")
+def cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("license_cache")
+
+
+@pytest.fixture
+def cache_file(cache_dir, request):
+    """Per-test cache path inside the shared session directory."""
+    return cache_dir / f"{request.node.name}.json"
+
+
 class TestCache:
-    def test_write_and_read(self, tmp_path):
+    def test_write_and_read(self, cache_file):
         """Write then read a cached license."""
-        cache_file = tmp_path / "license_cache.json"
         info = LicenseInfo(valid=True, tier="pro", customer_name="Test Corp")
 
         with patch("artefact_mcp.core.license.CACHE_FILE", cache_file):
@@ -119,9 +133,8 @@ class TestCache:
         assert result.tier == "pro"
         assert result.customer_name == "Test Corp"
 
-    def test_cache_miss_wrong_key(self, tmp_path):
+    def test_cache_miss_wrong_key(self, cache_file):
         """Wrong key returns None."""
-        cache_file = tmp_path / "license_cache.json"
         info = LicenseInfo(valid=True, tier="pro")
 
         with patch("artefact_mcp.core.license.CACHE_FILE", cache_file):
@@ -130,16 +143,15 @@ class TestCache:
 
         assert result is None
 
-    def test_cache_expired(self, tmp_path):
+    def test_cache_expired(self, cache_file):
         """Expired cache returns None."""
-        cache_file = tmp_path / "license_cache.json"
         info = LicenseInfo(valid=True, tier="pro")
 
         with patch("artefact_mcp.core.license.CACHE_FILE", cache_file):
             _write_cache("test-key", info)
 
             # Manually expire the cache
-            data = json.loads(cache_file.read_text())
+            data = json.loads(cache_file.read_bytes())
             data["cached_at"] = time.time() - 100000
             cache_file.write_text(json.dumps(data))
 
@@ -147,9 +159,20 @@ class TestCache:
 
         assert result is None
 
-    def test_cache_no_file(self, tmp_path):
+    def test_failed_replace_leaves_no_temp_file(self, cache_file):
+        """A failed rename is swallowed and its temp file cleaned up."""
+        info = LicenseInfo(valid=True, tier="pro")
+
+        with patch("artefact_mcp.core.license.CACHE_FILE", cache_file):
+            with patch("artefact_mcp.core.license.os.replace", side_effect=OSError("busy")):
+                _write_cache("test-key", info)
+
+        assert not cache_file.exists()
+        assert not list(cache_file.parent.glob(f".{cache_file.name}.*.tmp"))
+
+    def test_cache_no_file(self, cache_dir):
         """Missing cache file returns None."""
-        cache_file = tmp_path / "nonexistent" / "cache.json"
+        cache_file = cache_dir / "nonexistent" / "cache.json"
         with patch("artefact_mcp.core.license.CACHE_FILE", cache_file):
             result = _read_cache("any-key")
         assert result is None
@@ -5,16 +5,21 @@ import pytest
 from artefact_mcp.tools.pipeline import score_pipeline
 
 
+@pytest.fixture(scope="session")
+def pipeline_result():
+    return score_pipeline(source="sample")
+
+
 class TestScorePipelineTool:
-    def test_sample_pipeline(self):
-        result = score_pipeline(source="sample")
+    def test_sample_pipeline(self, pipeline_result):
+        result = pipeline_result
         assert result["total_deals"] == 8
         assert result["total_value"] > 0
         assert 0 <= result["health_score"] <= 100
         assert result["health_label"] in ("Healthy", "Warning", "Critical")
 
-    def test_velocity_metrics(self):
-        result = score_pipeline(source="sample")
+    def test_velocity_metrics(self, pipeline_result):
+        result = pipeline_result
         assert "velocity" in result
         velocity = result["velocity"]
         assert "avg_days_per_stage" in velocity
@@ -22,16 +27,16 @@ class TestScorePipelineTool:
         assert "overall_cycle_days" in velocity
         assert isinstance(velocity["overall_cycle_days"], int)
 
-    def test_conversion_rates(self):
-        result = score_pipeline(source="sample")
+    def test_conversion_rates(self, pipeline_result):
+        result = pipeline_result
         assert "conversion_rates" in result
         rates = result["conversion_rates"]
         for key, value in rates.items():
             assert "->" in key
             assert 0 <= value <= 100
 
-    def test_at_risk_deals(self):
-        result = score_pipeline(source="sample")
+    def test_at_risk_deals(self, pipeline_result):
+        result = pipeline_result
         assert "at_risk_deals" in result
         # Sample data includes stalled deals
         assert len(result["at_risk_deals"]) > 0
@@ -40,12 +45,20 @@ class TestScorePipelineTool:
             assert "risk_reasons" in deal
             assert len(deal["risk_reasons"]) > 0
 
-    def test_stage_distribution(self):
-        result = score_pipeline(source="sample")
+    def test_stage_distribution(self, pipeline_result):
+        result = pipeline_result
         assert "stage_distribution" in result
         total_count = sum(s["count"] for s in result["stage_distribution"].values())
         assert total_count == 8
 
+    def test_hubspot_source(self, hubspot_client):
+        result = score_pipeline(source="hubspot", hubspot_client=hubspot_client)
+        assert result["total_deals"] == 4
+        assert result["total_value"] == 90500
+        # Stage labels come from the HubSpot pipeline definition
+        assert set(result["stage_distribution"]) == {"Discovery", "Qualified", "Demo", "Contract Sent"}
+        assert "Discovery -> Qualified" in result["conversion_rates"]
+
     def test_invalid_source(self):
         with pytest.raises(ValueError, match="Invalid source"):
             score_pipeline(source="invalid")
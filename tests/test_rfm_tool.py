@@ -26,78 +26,85 @@ class TestPercentile:
         assert 72 < result <= 82
 
 
-class TestRFMScorer:
-    def test_recency_very_recent(self):
-        scorer = RFMScorer()
-        assert scorer.score_recency(10) == 5
+@pytest.fixture(scope="session")
+def rfm_scorer():
+    return RFMScorer()
 
-    def test_recency_dormant(self):
-        scorer = RFMScorer()
-        assert scorer.score_recency(400) == 1
 
-    def test_frequency_high(self):
-        scorer = RFMScorer()
-        assert scorer.score_frequency(12) == 5
+@pytest.fixture(scope="session")
+def segmenter():
+    return Segmenter()
 
-    def test_frequency_one(self):
-        scorer = RFMScorer()
-        assert scorer.score_frequency(1) == 1
 
-    def test_monetary_percentile(self):
-        scorer = RFMScorer()
-        revenues = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
-        assert scorer.score_monetary(100, revenues) == 5
-        assert scorer.score_monetary(10, revenues) == 1
+@pytest.fixture(scope="session")
+def icp_analyzer():
+    return ICPAnalyzer()
+
+
+class TestRFMScorer:
+    @pytest.mark.parametrize("days,expected", [(10, 5), (400, 1)], ids=["very_recent", "dormant"])
+    def test_recency(self, rfm_scorer, days, expected):
+        assert rfm_scorer.score_recency(days) == expected
+
+    @pytest.mark.parametrize("count,expected", [(12, 5), (1, 1)], ids=["high", "one"])
+    def test_frequency(self, rfm_scorer, count, expected):
+        assert rfm_scorer.score_frequency(count) == expected
 
-    def test_b2b_service_longer_windows(self):
+    @pytest.mark.parametrize("revenue,expected", [(100, 5), (10, 1)])
+    def test_monetary_percentile(self, rfm_scorer, revenue, expected):
+        revenues = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+        assert rfm_scorer.score_monetary(revenue, revenues) == expected
+
+    @pytest.mark.parametrize("monetary", [
+        {"method": "percentile", "percentiles": [80, 60, 40, 20]},
+        {"method": "fixed"},
+    ], ids=["percentile", "fixed"])
+    def test_monetary_batch_matches_scalar(self, monetary):
+        scorer = RFMScorer({"monetary": monetary})
+        revenues = [185000, 340000, 92000, 67000, 18000, 92000, 0, 420000]
+        expected = [scorer.score_monetary(r, revenues) for r in revenues]
+        assert scorer.score_monetary_batch(revenues) == expected
+
+    def test_b2b_service_longer_windows(self, rfm_scorer):
         scorer = B2BServiceScorer()
         # 45 days should be score 5 for B2B service (window is 60)
         assert scorer.score_recency(45) == 5
         # But only 4 for default scorer
-        default = RFMScorer()
-        assert default.score_recency(45) == 4
+        assert rfm_scorer.score_recency(45) == 4
 
 
 class TestSegmenter:
-    def test_champion(self):
-        s = Segmenter()
-        assert s.classify(5, 5, 5) == "Champions"
+    def test_champion(self, segmenter):
+        assert segmenter.classify(5, 5, 5) == "Champions"
 
-    def test_lost(self):
-        s = Segmenter()
-        assert s.classify(1, 1, 1) == "Lost"
+    def test_lost(self, segmenter):
+        assert segmenter.classify(1, 1, 1) == "Lost"
 
-    def test_at_risk(self):
-        s = Segmenter()
-        assert s.classify(2, 3, 4) == "At Risk"
+    def test_at_risk(self, segmenter):
+        assert segmenter.classify(2, 3, 4) == "At Risk"
 
-    def test_cant_lose(self):
-        s = Segmenter()
-        assert s.classify(1, 5, 5) == "Can't Lose Them"
+    def test_cant_lose(self, segmenter):
+        assert segmenter.classify(1, 5, 5) == "Can't Lose Them"
 
-    def test_new_customer(self):
-        s = Segmenter()
-        assert s.classify(5, 1, 3) == "New Customers"
+    def test_new_customer(self, segmenter):
+        assert segmenter.classify(5, 1, 3) == "New Customers"
 
-    def test_all_segments_exist(self):
-        s = Segmenter()
-        assert len(s.get_all_segments()) == 11
+    def test_all_segments_exist(self, segmenter):
+        assert len(segmenter.get_all_segments()) == 11
 
 
 class TestICPAnalyzer:
-    def test_filter_top_performers(self):
-        analyzer = ICPAnalyzer()
+    def test_filter_top_performers(self, icp_analyzer):
         clients = [
             {"segment": "Champions", "rfm_total": 15},
             {"segment": "Lost", "rfm_total": 3},
             {"segment": "Loyal Customers", "rfm_total": 12},
         ]
-        top = analyzer.filter_top_performers(clients)
+        top = icp_analyzer.filter_top_performers(clients)
         assert len(top) == 2
         assert top[0]["segment"] == "Champions"
 
-    def test_extract_patterns(self):
-        analyzer = ICPAnalyzer()
+    def test_extract_patterns(self, icp_analyzer):
         top = [
             {"industry": "SaaS", "employee_count": "51-200", "company_revenue": "$5M-$20M", "state_region": "Ontario"},
             {"industry": "SaaS", "employee_count": "51-200", "company_revenue": "$5M-$20M", "state_region": "Quebec"},
@@ -105,22 +112,32 @@ class TestICPAnalyzer:
         all_clients = top + [
             {"industry": "Retail", "employee_count": "1-10", "company_revenue": "<$1M", "state_region": "Ontario"},
         ]
-        patterns = analyzer.extract_patterns(top, all_clients)
+        patterns = icp_analyzer.extract_patterns(top, all_clients)
         assert "industry" in patterns
         assert len(patterns["industry"]["distribution"]) > 0
 
 
+@pytest.fixture(scope="session")
+def rfm_sample_result():
+    return run_rfm_analysis(source="sample")
+
+
+@pytest.fixture(scope="session")
+def rfm_saas_result():
+    return run_rfm_analysis(source="sample", industry_preset="saas")
+
+
 class TestRFMTool:
-    def test_sample_analysis(self):
-        result = run_rfm_analysis(source="sample")
+    def test_sample_analysis(self, rfm_sample_result):
+        result = rfm_sample_result
         assert result["total_clients"] == 12
         assert "segment_distribution" in result
         assert "icp_patterns" in result
         assert "summary" in result
         assert result["summary"]["total_revenue"] > 0
 
-    def test_sample_with_preset(self):
-        result = run_rfm_analysis(source="sample", industry_preset="saas")
+    def test_sample_with_preset(self, rfm_saas_result):
+        result = rfm_saas_result
         assert result["total_clients"] == 12
         assert result["industry_preset"] == "saas"
 
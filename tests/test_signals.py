@@ -1,21 +1,39 @@
 """Tests for signal detection tool."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from artefact_mcp.tools.signals import detect_signals, SIGNAL_TYPES
+from artefact_mcp.tools.pipeline import _get_sample_deals
+from artefact_mcp.tools.signals import (
+    detect_signals,
+    CRITICAL_SIGNAL_STRENGTH,
+    SIGNAL_TYPES,
+)
+
+pytestmark = pytest.mark.filterwarnings("error")
+
+SAMPLE_DEAL_COUNT = 8  # deals in the built-in sample pipeline
+EXPECTED_TAXONOMY_LEN = 6
+
+
+@pytest.fixture(scope="session")
+def sample_result():
+    return detect_signals(source="sample")
 
 
 class TestDetectSignals:
-    def test_sample_signals(self):
-        result = detect_signals(source="sample")
+    def test_sample_signals(self, sample_result):
+        result = sample_result
         assert "signals" in result
         assert "summary" in result
-        assert result["deals_scanned"] == 8
+        assert result["deals_scanned"] == SAMPLE_DEAL_COUNT
         assert result["summary"]["total_signals"] >= 0
 
-    def test_signal_structure(self):
-        result = detect_signals(source="sample")
-        for signal in result["signals"]:
+    def test_signal_invariants(self, sample_result):
+        """Structure, strength range, taxonomy membership and critical cut in one pass."""
+        critical = sample_result["summary"].get("critical_signals", [])
+        for signal in sample_result["signals"]:
             assert "signal_type" in signal
             assert "signal_name" in signal
             assert "signal_strength" in signal
@@ -23,40 +41,31 @@ class TestDetectSignals:
             assert "recommended_action" in signal
             assert 0 <= signal["signal_strength"] <= 1.0
             assert signal["signal_type"] in SIGNAL_TYPES
+            assert (signal in critical) == (signal["signal_strength"] >= CRITICAL_SIGNAL_STRENGTH)
 
-    def test_signal_types_in_taxonomy(self):
-        result = detect_signals(source="sample")
+    def test_signal_types_in_taxonomy(self, sample_result):
+        result = sample_result
         assert "signal_taxonomy" in result
-        assert len(result["signal_taxonomy"]) == 6
+        assert len(result["signal_taxonomy"]) == EXPECTED_TAXONOMY_LEN
         for signal_type in SIGNAL_TYPES:
             assert signal_type in result["signal_taxonomy"]
 
-    def test_signals_sorted_by_strength(self):
-        result = detect_signals(source="sample")
-        signals = result["signals"]
-        if len(signals) > 1:
-            for i in range(len(signals) - 1):
-                assert signals[i]["signal_strength"] >= signals[i + 1]["signal_strength"]
-
-    def test_summary_critical_signals(self):
-        result = detect_signals(source="sample")
-        summary = result["summary"]
-        critical = summary.get("critical_signals", [])
-        for sig in critical:
-            assert sig["signal_strength"] >= 0.7
-
-    def test_detects_velocity_anomaly(self):
+    def test_signals_sorted_by_strength(self, sample_result):
+        strengths = [s["signal_strength"] for s in sample_result["signals"]]
+        assert strengths == sorted(strengths, reverse=True)
+
+    def test_detects_velocity_anomaly(self, sample_result):
         """Sample data includes stalled deals that should trigger velocity signals."""
-        result = detect_signals(source="sample")
+        result = sample_result
         velocity_signals = [
             s for s in result["signals"] if s["signal_type"] == "velocity_anomaly"
         ]
         # Sample data has deals open 100+ days — should detect anomalies
         assert len(velocity_signals) > 0
 
-    def test_detects_pipeline_signals(self):
+    def test_detects_pipeline_signals(self, sample_result):
         """Sample data should trigger at least some pipeline signals."""
-        result = detect_signals(source="sample")
+        result = sample_result
         # Sample data should produce multiple signal types
         assert result["summary"]["total_signals"] >= 2
         detected_types = result["summary"]["signal_types_detected"]
@@ -70,7 +79,45 @@ class TestDetectSignals:
         with pytest.raises(ValueError, match="HubSpot client required"):
             detect_signals(source="hubspot")
 
-    def test_scan_date_present(self):
-        result = detect_signals(source="sample")
+    def test_scan_date_present(self, sample_result):
+        result = sample_result
         assert "scan_date" in result
         assert len(result["scan_date"]) == 10  # YYYY-MM-DD
+
+
+class TestDetectSignalsHubSpot:
+    def _client(self, stages=None, stages_error=None):
+        client = MagicMock()
+        client.fetch_open_deals.return_value = _get_sample_deals()
+        if stages_error:
+            client.fetch_pipeline_stages.side_effect = stages_error
+        else:
+            client.fetch_pipeline_stages.return_value = stages or []
+        return client
+
+    def test_fetches_deals_and_stages(self):
+        client = self._client(stages=[
+            {"id": "appointmentscheduled", "label": "Intro Call", "display_order": 0},
+            {"id": "qualifiedtobuy", "label": "Qualified", "display_order": 1},
+        ])
+        result = detect_signals(source="hubspot", hubspot_client=client, pipeline_id="p1")
+        client.fetch_open_deals.assert_called_once_with("p1")
+        client.fetch_pipeline_stages.assert_called_once_with("p1")
+        assert result["deals_scanned"] == SAMPLE_DEAL_COUNT
+        stages = {s["evidence"].get("stage") for s in result["signals"]}
+        assert "Intro Call" in stages
+
+    def test_stage_fetch_failure_falls_back_to_defaults(self):
+        client = self._client(stages_error=ValueError("HubSpot API error (500)"))
+        result = detect_signals(source="hubspot", hubspot_client=client)
+        client.fetch_pipeline_stages.assert_called_once_with("default")
+        assert result["deals_scanned"] == SAMPLE_DEAL_COUNT
+        stages = {s["evidence"].get("stage") for s in result["signals"]}
+        assert "Appointment Scheduled" in stages
+
+    def test_hubspot_client_against_replayed_api(self, hubspot_client):
+        result = detect_signals(source="hubspot", hubspot_client=hubspot_client)
+        assert result["deals_scanned"] == 4
+        assert result["summary"]["total_signals"] > 0
+        for signal in result["signals"]:
+            assert signal["signal_type"] in SIGNAL_TYPES